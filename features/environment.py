@@ -0,0 +1,29 @@
+"""
+Hooks de entorno de Behave.
+
+Todos los pasos usan context.session, la sesión HTTP compartida de features/support/api_client.py.
+Si PAYLOAD_PROFILE=1 se instrumentan todas las peticiones HTTP de la suite y al final se imprime
+y se guarda el reporte de tamaño de payload y costo de decodificación por endpoint.
+"""
+
+from features.support.api_client import session
+from features.support.payload_profiler import is_enabled, profiler
+
+
+def before_all(context):
+    """
+    Publica la sesión HTTP compartida y activa el perfilador de payloads antes de ejecutar cualquier feature.
+    """
+    context.session = session
+    if is_enabled():
+        profiler.install()
+
+
+def after_all(context):
+    """
+    Restaura requests, imprime el reporte y lo guarda en PAYLOAD_PROFILE_OUTPUT.
+    """
+    if is_enabled():
+        profiler.uninstall()
+        print(profiler.format_report())
+        print(f"Payload profile written to {profiler.write_report()}")
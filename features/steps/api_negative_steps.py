@@ -16,7 +16,7 @@ def step_impl(context):
     Realiza una petición simple al endpoint base y valida el status.
     """
     url = f"{BASE_URL}/pokemon/1"
-    resp = requests.get(url)
+    resp = context.session.get(url)
     assert resp.status_code == 200, f"PokeAPI is not available, status: {resp.status_code}"
 
 
@@ -29,7 +29,7 @@ def step_impl(context, invalid_id):
     """
     url = f"{BASE_URL}/pokemon/{invalid_id}"
     context.start_time = time.time()
-    context.response = requests.get(url)
+    context.response = context.session.get(url)
     context.elapsed_time = time.time() - context.start_time
 
 @then('the error response should contain a descriptive message')
@@ -61,7 +61,7 @@ def step_impl(context, invalid_id):
     """
     url = f"{BASE_URL}/ability/{invalid_id}"
     context.start_time = time.time()
-    context.response = requests.get(url)
+    context.response = context.session.get(url)
     context.elapsed_time = time.time() - context.start_time
 
 
@@ -75,7 +75,7 @@ def step_impl(context, endpoint):
     url = f"{BASE_URL}/{endpoint}"
     last_resp = None
     for _ in range(10):  # bombardear con requests
-        resp = requests.get(url)
+        resp = context.session.get(url)
         last_resp = resp
         if resp.status_code == 429:
             context.response = resp
@@ -93,7 +93,7 @@ def step_impl(context, pokemon_name):
     url = f"{BASE_URL}/pokemon/{pokemon_name}"
     try:
         # Forzar timeout bajo (ej. 0.001s)
-        context.response = requests.get(url, timeout=0.001)
+        context.response = context.session.get(url, timeout=0.001)
     except requests.exceptions.Timeout:
         context.response = None  # Marca que fue timeout
 
@@ -114,7 +114,7 @@ def step_impl(context, invalid_id):
     Guarda la respuesta HTTP en el contexto.
     """
     url = f"{BASE_URL}/move/{invalid_id}"
-    context.response = requests.get(url)
+    context.response = context.session.get(url)
 
 @then('the response should not expose sensitive information')
 def step_impl(context):
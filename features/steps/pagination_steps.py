@@ -9,7 +9,6 @@ de datos en la API de Pokémon.
 
 import time
 from urllib.parse import urlparse, parse_qs
-import requests  # Usado para hacer peticiones HTTP
 from behave import given, when, then
 from features.support.pokemon_model import Pokemon
 
@@ -19,9 +18,10 @@ DEFAULT_LIMIT = 20  # Límite por defecto esperado
 # Función auxiliar para obtener la lista de Pokémon
 # Permite parametrizar limit y offset, y retorna la respuesta y el JSON
 
-def _get_list(limit=None, offset=None, base_url="https://pokeapi.co/api/v2"):
+def _get_list(session, limit=None, offset=None, base_url="https://pokeapi.co/api/v2"):
     """
     Solicita el recurso y retorna (response, json_data)
+    :param session: sesión HTTP compartida (context.session)
     :param limit: cantidad máxima de resultados
     :param offset: desplazamiento en la lista
     :param base_url: URL base de la API
@@ -32,7 +32,7 @@ def _get_list(limit=None, offset=None, base_url="https://pokeapi.co/api/v2"):
         params["limit"] = limit
     if offset is not None:
         params["offset"] = offset
-    resp = requests.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    resp = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
     try:
         json_data = resp.json()
     except ValueError:
@@ -51,35 +51,35 @@ def step_request_default(context):
     """
     Solicita la lista de Pokémon sin parámetros de paginación.
     """
-    context.resp, context.json = _get_list(base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, base_url=context.base_url)
 
 @when('I request the pokemon list with limit {limit:d} and offset {offset:d}')
 def step_request_with_params(context, limit, offset):
     """
     Solicita la lista de Pokémon con limit y offset.
     """
-    context.resp, context.json = _get_list(limit=limit, offset=offset, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=limit, offset=offset, base_url=context.base_url)
 
 @when('I request the pokemon list with limit {limit:d} and offset 0')
 def step_request_limit(context, limit):
     """
     Solicita la lista de Pokémon con limit y offset=0.
     """
-    context.resp, context.json = _get_list(limit=limit, offset=0, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=limit, offset=0, base_url=context.base_url)
 
 @when('I request the list with limit {limit:d} and offset {offset:d}')
 def step_request_list(context, limit, offset):
     """
     Solicita la lista de Pokémon con limit y offset (nombres alternativos para claridad).
     """
-    context.resp, context.json = _get_list(limit=limit, offset=offset, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=limit, offset=offset, base_url=context.base_url)
 
 @given('I request the list with limit 20 and offset 0')
 def step_request_offset_0(context):
     """
     Solicita la lista con limit=20 y offset=0 y la guarda en context.pages.
     """
-    context.resp, context.json = _get_list(limit=20, offset=0, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=20, offset=0, base_url=context.base_url)
     if not hasattr(context, "pages"): context.pages = []
     context.pages.append({"offset": 0, "resp": context.resp, "json": context.json})
 
@@ -88,7 +88,7 @@ def step_request_offset_20(context):
     """
     Solicita la lista con limit=20 y offset=20 y la guarda en context.pages.
     """
-    context.resp, context.json = _get_list(limit=20, offset=20, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=20, offset=20, base_url=context.base_url)
     if not hasattr(context, "pages"): context.pages = []
     context.pages.append({"offset": 20, "resp": context.resp, "json": context.json})
 
@@ -97,7 +97,7 @@ def step_request_offset_40(context):
     """
     Solicita la lista con limit=20 y offset=40 y la guarda en context.pages.
     """
-    context.resp, context.json = _get_list(limit=20, offset=40, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=20, offset=40, base_url=context.base_url)
     if not hasattr(context, "pages"): context.pages = []
     context.pages.append({"offset": 40, "resp": context.resp, "json": context.json})
 
@@ -106,7 +106,7 @@ def step_get_count(context):
     """
     Obtiene el total de Pokémon disponibles en la API y lo guarda en context.total_count.
     """
-    resp, json_data = _get_list(limit=1, offset=0, base_url=context.base_url)
+    resp, json_data = _get_list(context.session, limit=1, offset=0, base_url=context.base_url)
     assert resp.status_code == 200, f"Cannot obtain count, status={resp.status_code}"
     context.total_count = json_data.get("count")
     assert isinstance(context.total_count, int) and context.total_count > 0, "Invalid count value"
@@ -117,7 +117,7 @@ def step_request_offset_out_of_range(context):
     Solicita la lista con un offset fuera de rango para probar la respuesta vacía.
     """
     offset = context.total_count + 1000
-    context.resp, context.json = _get_list(limit=20, offset=offset, base_url=context.base_url)
+    context.resp, context.json = _get_list(context.session, limit=20, offset=offset, base_url=context.base_url)
 
 @then('the pagination response status should be {expected_status:d}')
 def step_check_status(context, expected_status):
@@ -159,7 +159,7 @@ def step_check_next_prev(context):
             if link:
                 parsed = urlparse(link)
                 assert parsed.scheme in ("http", "https"), f"{link_key} is not a valid URL: {link}"
-                r = requests.get(link, timeout=DEFAULT_TIMEOUT)
+                r = context.session.get(link, timeout=DEFAULT_TIMEOUT)
                 assert r.status_code == 200, f"{link_key} URL returned {r.status_code}: {link}"
 
 @then('there should be no duplicate pokemon between those pages')
@@ -230,7 +230,7 @@ def step_capture_names_given(context):
     """
     Solicita la lista con limit=20 y offset=40, guarda los nombres para comparar consistencia temporal.
     """
-    resp, json_data = _get_list(limit=20, offset=40, base_url=context.base_url)
+    resp, json_data = _get_list(context.session, limit=20, offset=40, base_url=context.base_url)
     assert resp.status_code == 200, f"Failed to fetch page for consistency check, status {resp.status_code}"
     results = json_data.get("results", [])
     names = [r.get("name") for r in results]
@@ -244,7 +244,7 @@ def step_wait_and_request_again(context, seconds):
     """
     time.sleep(seconds)
     offset = context.last_offset if hasattr(context, "last_offset") else 40
-    context.resp_second, context.json_second = _get_list(limit=20, offset=offset, base_url=context.base_url)
+    context.resp_second, context.json_second = _get_list(context.session, limit=20, offset=offset, base_url=context.base_url)
 
 @then('the names returned should be identical (order and items)')
 def step_assert_names_identical(context):
@@ -1,5 +1,4 @@
 import os
-import requests  # Librería para hacer peticiones HTTP
 from behave import given, when, then  # Decoradores para definir pasos de pruebas BDD
 from jsonschema import validate, ValidationError  # Validación de esquemas JSON
 
@@ -25,7 +24,7 @@ def step_set_endpoint(context, endpoint):
 @when('I send a GET request')
 def step_send_get(context):
     url = f"{BASE_URL}{context.endpoint}"
-    context.response = requests.get(url, timeout=8)  # Realiza la petición GET
+    context.response = context.session.get(url, timeout=8)  # Realiza la petición GET
     try:
         context.json = context.response.json()  # Intenta obtener el JSON de la respuesta
     except ValueError:
@@ -10,7 +10,6 @@ Buenas prácticas aplicadas:
 - Se incluyen aserciones informativas para facilitar el diagnóstico de errores.
 """
 
-import requests
 import time
 from behave import when, then, given
 
@@ -21,7 +20,7 @@ def step_impl(context, endpoint, payload):
     """
     Envía una petición GET con un payload malicioso al endpoint indicado.
     """
-    context.response = requests.get(f"{BASE_URL}{endpoint}/{payload}")
+    context.response = context.session.get(f"{BASE_URL}{endpoint}/{payload}")
 
 @then('the response code should not be 500')
 def step_impl(context):
@@ -47,7 +46,7 @@ def step_impl(context, path):
     """
     responses = []
     for _ in range(50):
-        r = requests.get(f"{BASE_URL}{path}")
+        r = context.session.get(f"{BASE_URL}{path}")
         responses.append(r.status_code)
     context.responses = responses
 
@@ -70,7 +69,7 @@ def step_impl(context, path):
     """
     Envía una petición GET con el header de correlación para validar logging estructurado.
     """
-    context.response = requests.get(f"{BASE_URL}{path}", headers={"X-Correlation-ID": "test-123"})
+    context.response = context.session.get(f"{BASE_URL}{path}", headers={"X-Correlation-ID": "test-123"})
 
 @given('I have executed tests for multiple endpoints')
 def step_impl(context):
@@ -100,7 +99,7 @@ def step_impl(context, path):
     """
     Envía una petición GET al endpoint indicado y guarda la respuesta en el contexto.
     """
-    context.response = requests.get(f"{BASE_URL}{path}")
+    context.response = context.session.get(f"{BASE_URL}{path}")
 
 @when('I simulate a slow response from "{path}"')
 def step_impl(context, path):
@@ -108,7 +107,7 @@ def step_impl(context, path):
     Simula una respuesta lenta del endpoint indicado y mide el tiempo de respuesta.
     """
     start = time.time()
-    context.response = requests.get(f"{BASE_URL}{path}", timeout=10)
+    context.response = context.session.get(f"{BASE_URL}{path}", timeout=10)
     duration = time.time() - start
     context.response_time = duration
 
@@ -0,0 +1,11 @@
+"""
+Sesión HTTP compartida para las pruebas de la PokeAPI.
+
+Todos los pasos de Behave, el modelo de Pokémon y las pruebas unitarias usan esta misma sesión, de modo que
+las conexiones TLS a la API se reutilizan (keep-alive) en lugar de abrirse en cada petición.
+Con run_tests.py ambas suites corren en el mismo proceso y comparten también estas conexiones.
+"""
+
+import requests
+
+session = requests.Session()  # Sesión única del proceso
@@ -0,0 +1,349 @@
+"""
+Perfilador de tamaño de payload y costo de decodificación por endpoint.
+
+Este archivo define la clase PayloadProfiler, que instrumenta todas las peticiones hechas con `requests`
+(pasos de Behave, modelo de Pokémon y el cliente HttpSession de Locust) y registra, por plantilla de ruta:
+- Content-Encoding de la respuesta
+- bytes transferidos por la red (comprimidos) y bytes decodificados
+- tiempo de decodificación JSON
+- memoria retenida por los objetos Python resultantes
+
+El modo se activa con la variable de entorno PAYLOAD_PROFILE=1 y el reporte se escribe en
+PAYLOAD_PROFILE_OUTPUT (por defecto payload_profile.json).
+
+Buenas prácticas:
+- Los pasos siguen usando resp.json() como siempre; el cuerpo se lee sin decodificar para contar
+  los bytes reales de red (también con Transfer-Encoding: chunked) y requests lo descomprime igual que antes.
+- Por cada ruta se acumulan totales (bytes de red y decodificados) de todas las respuestas, pero solo se
+  guardan las primeras PAYLOAD_PROFILE_SAMPLES respuestas JSON (por defecto 5) para medir decodificación y
+  memoria; así el uso de memoria queda acotado también en pruebas de carga largas.
+- La decodificación JSON y el cálculo de memoria se hacen al generar el reporte, no dentro de la petición,
+  para no sumar costo del perfilador a los tiempos medidos por los pasos y por Locust.
+- Desactivado por defecto, sin costo cuando no se usa.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+
+ENABLED_ENV = "PAYLOAD_PROFILE"
+OUTPUT_ENV = "PAYLOAD_PROFILE_OUTPUT"
+SAMPLES_ENV = "PAYLOAD_PROFILE_SAMPLES"
+DEFAULT_OUTPUT = "payload_profile.json"
+DEFAULT_SAMPLES = 5
+
+
+def is_enabled() -> bool:
+    """
+    Indica si el modo de perfilado está activo según la variable de entorno PAYLOAD_PROFILE.
+    """
+    return os.getenv(ENABLED_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def route_template(url: str) -> str:
+    """
+    Convierte una URL concreta en su plantilla de ruta para agrupar métricas.
+    Ejemplos:
+    - https://pokeapi.co/api/v2/pokemon/pikachu -> /api/v2/pokemon/{id}
+    - https://pokeapi.co/api/v2/pokemon?limit=20 -> /api/v2/pokemon
+    """
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    if segments[:2] == ["api", "v2"] and len(segments) > 3:
+        # En PokeAPI el segmento tras el recurso es el id o el nombre
+        segments[3] = "{id}"
+    else:
+        segments = ["{id}" if s.isdigit() else s for s in segments]
+    return "/" + "/".join(segments)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Calcula la memoria retenida por un objeto decodificado de JSON (dict, list, str, números).
+    Cada objeto se cuenta una sola vez aunque esté referenciado varias veces.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return total
+
+
+class RouteStats:
+    def __init__(self, route: str, max_samples: int):
+        """
+        Totales acumulados de una plantilla de ruta.
+        :param route: plantilla de ruta (string)
+        :param max_samples: cantidad máxima de cuerpos JSON que se guardan para medir decodificación y memoria
+        """
+        self.route: str = route
+        self.max_samples: int = max_samples
+        self.requests: int = 0
+        self.json_requests: int = 0
+        self.content_encodings = set()
+        self.wire_bytes_total: int = 0
+        self.wire_measured: int = 0
+        self.wire_unknown: int = 0
+        self.decoded_bytes_total: int = 0
+        self.decoded_bytes_measured: int = 0  # bytes decodificados de respuestas con tamaño de red conocido
+        self.sampled: int = 0  # cuerpos JSON tomados como muestra (analizados o pendientes)
+        self.pending_bodies: List[bytes] = []  # muestras aún sin analizar
+        self.analyzed: int = 0
+        self.decode_seconds_total: float = 0.0
+        self.object_bytes_total: int = 0
+        self.object_bytes_max: int = 0
+
+    def add(self, content_encoding: str, content_type: str, wire_bytes: Optional[int], body: bytes) -> None:
+        """
+        Suma una respuesta a los totales; el cuerpo solo se guarda si aún faltan muestras.
+        :param wire_bytes: bytes recibidos por la red (comprimidos), None si no se pudieron medir
+        :param body: cuerpo ya descomprimido
+        """
+        self.requests += 1
+        self.content_encodings.add(content_encoding)
+        self.decoded_bytes_total += len(body)
+        if wire_bytes is None:
+            self.wire_unknown += 1
+        else:
+            self.wire_measured += 1
+            self.wire_bytes_total += wire_bytes
+            self.decoded_bytes_measured += len(body)
+        if "json" in content_type and body:
+            self.json_requests += 1
+            if self.sampled < self.max_samples:
+                self.sampled += 1
+                self.pending_bodies.append(body)
+
+    def analyze(self, bodies: List[bytes]) -> None:
+        """
+        Decodifica las muestras JSON y acumula tiempo de decodificación y memoria retenida.
+        """
+        for body in bodies:
+            start = time.perf_counter()
+            try:
+                data = json.loads(body)
+            except ValueError:
+                continue
+            self.decode_seconds_total += time.perf_counter() - start
+            size = deep_sizeof(data)
+            self.analyzed += 1
+            self.object_bytes_total += size
+            self.object_bytes_max = max(self.object_bytes_max, size)
+
+
+class PayloadProfiler:
+    def __init__(self, max_samples: Optional[int] = None):
+        """
+        Inicializa el perfilador sin datos y sin instrumentar `requests`.
+        :param max_samples: muestras JSON por ruta; por defecto PAYLOAD_PROFILE_SAMPLES o 5
+        """
+        if max_samples is None:
+            max_samples = int(os.getenv(SAMPLES_ENV, DEFAULT_SAMPLES))
+        self.max_samples: int = max_samples
+        self.routes: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+        self._original_send = None
+
+    def install(self) -> None:
+        """
+        Instrumenta requests.Session.send para medir cada respuesta.
+        requests.get() y el HttpSession de Locust pasan por este método.
+        """
+        if self._original_send is not None:
+            return
+        original_send = requests.Session.send
+        profiler = self
+
+        def send(session, request, **kwargs):
+            if kwargs.get("stream"):
+                # Con stream=True el llamador consume el cuerpo; no se mide
+                return original_send(session, request, **kwargs)
+            kwargs["stream"] = True
+            response = original_send(session, request, **kwargs)
+            wire_bytes = profiler._read_wire_body(response)
+            profiler.record(response, wire_bytes)
+            return response
+
+        self._original_send = original_send
+        requests.Session.send = send
+
+    def uninstall(self) -> None:
+        """
+        Restaura requests.Session.send original.
+        """
+        if self._original_send is None:
+            return
+        requests.Session.send = self._original_send
+        self._original_send = None
+
+    def reset(self) -> None:
+        """
+        Descarta los datos registrados.
+        """
+        with self._lock:
+            self.routes = {}
+
+    @staticmethod
+    def _read_wire_body(response: requests.Response) -> Optional[int]:
+        """
+        Lee el cuerpo tal como llegó por la red (sin descomprimir) y retorna su tamaño.
+        Luego reemplaza response.raw por una copia en memoria para que requests lo descomprima como siempre.
+        Los errores de urllib3 se convierten igual que en requests.Response.iter_content.
+        Retorna None si la respuesta no viene de urllib3 (p. ej. un adaptador de pruebas).
+        """
+        raw = response.raw
+        if not isinstance(raw, urllib3.HTTPResponse):
+            return None
+        try:
+            body = b"".join(raw.stream(decode_content=False))
+        except urllib3.exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3.exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+        finally:
+            raw.release_conn()
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            headers=raw.headers,
+            status=raw.status,
+            reason=raw.reason,
+            preload_content=False,
+            decode_content=True,
+        )
+        return len(body)
+
+    def record(self, response: requests.Response, wire_bytes: Optional[int] = None) -> None:
+        """
+        Suma una respuesta a los totales de su ruta; el análisis JSON se hace en summary().
+        Si wire_bytes no se midió se usa Content-Length; si tampoco existe queda como desconocido (None).
+        Los errores al leer o descomprimir el cuerpo se propagan igual que sin perfilador.
+        """
+        body = response.content or b""
+        if wire_bytes is None:
+            content_length = response.headers.get("Content-Length", "")
+            wire_bytes = int(content_length) if content_length.isdigit() else None
+
+        route = route_template(response.url or response.request.url)
+        with self._lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats(route, self.max_samples)
+            stats.add(
+                content_encoding=response.headers.get("Content-Encoding", "identity"),
+                content_type=response.headers.get("Content-Type", ""),
+                wire_bytes=wire_bytes,
+                body=body,
+            )
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Agrega los datos por plantilla de ruta.
+        Cada fila incluye totales, promedios y el porcentaje del total de ancho de banda,
+        CPU de decodificación y memoria. Se ordena por bytes de red descendente.
+        Decodificación y memoria se miden sobre las muestras y se extrapolan a todas las respuestas JSON.
+        Las respuestas sin tamaño de red conocido cuentan en wire_unknown y no entran en bandwidth_pct.
+        """
+        with self._lock:
+            pending = [(stats, stats.pending_bodies) for stats in self.routes.values()]
+            for stats in self.routes.values():
+                stats.pending_bodies = []
+        # Se decodifica fuera del lock para no bloquear peticiones en curso
+        for stats, bodies in pending:
+            stats.analyze(bodies)
+
+        rows = []
+        with self._lock:
+            for stats in self.routes.values():
+                n = stats.requests
+                measured = stats.wire_measured
+                decode_ms_avg = 1000 * stats.decode_seconds_total / stats.analyzed if stats.analyzed else 0.0
+                object_bytes_avg = stats.object_bytes_total / stats.analyzed if stats.analyzed else 0.0
+                rows.append({
+                    "route": stats.route,
+                    "requests": n,
+                    "content_encodings": sorted(stats.content_encodings),
+                    "wire_bytes_total": stats.wire_bytes_total,
+                    "wire_measured": measured,
+                    "wire_unknown": stats.wire_unknown,
+                    "decoded_bytes_total": stats.decoded_bytes_total,
+                    "wire_bytes_avg": stats.wire_bytes_total / measured if measured else None,
+                    "decoded_bytes_avg": stats.decoded_bytes_total / n,
+                    "compression_ratio": (stats.decoded_bytes_measured / stats.wire_bytes_total
+                                          if stats.wire_bytes_total else None),
+                    "decode_samples": stats.analyzed,
+                    "decode_ms_avg": decode_ms_avg,
+                    "decode_ms_total": decode_ms_avg * stats.json_requests,
+                    "object_bytes_avg": object_bytes_avg,
+                    "object_bytes_max": stats.object_bytes_max,
+                    "object_bytes_total": object_bytes_avg * stats.json_requests,
+                })
+
+        total_wire = sum(r["wire_bytes_total"] for r in rows) or 1
+        total_decode = sum(r["decode_ms_total"] for r in rows) or 1
+        total_objects = sum(r["object_bytes_total"] for r in rows) or 1
+        for row in rows:
+            row["bandwidth_pct"] = 100 * row["wire_bytes_total"] / total_wire if row["wire_measured"] else None
+            row["cpu_pct"] = 100 * row["decode_ms_total"] / total_decode
+            row["memory_pct"] = 100 * row["object_bytes_total"] / total_objects
+        rows.sort(key=lambda r: r["wire_bytes_total"], reverse=True)
+        return rows
+
+    def format_report(self) -> str:
+        """
+        Genera una tabla de texto con las rutas que dominan ancho de banda, CPU y memoria.
+        """
+        def fmt(value, spec):
+            return "?" if value is None else format(value, spec)
+
+        rows = self.summary()
+        header = (f"{'route':<32} {'reqs':>5} {'encoding':<10} {'wire avg':>10} {'decoded avg':>12} "
+                  f"{'ratio':>6} {'decode ms':>10} {'object avg':>11} {'bw %':>6} {'cpu %':>6} {'mem %':>6}")
+        lines = ["Payload profile per route", header, "-" * len(header)]
+        for r in rows:
+            lines.append(
+                f"{r['route']:<32} {r['requests']:>5} {','.join(r['content_encodings']):<10} "
+                f"{fmt(r['wire_bytes_avg'], '>10.0f'):>10} {r['decoded_bytes_avg']:>12.0f} "
+                f"{fmt(r['compression_ratio'], '>6.1f'):>6} "
+                f"{r['decode_ms_avg']:>10.2f} {r['object_bytes_avg']:>11.0f} "
+                f"{fmt(r['bandwidth_pct'], '>6.1f'):>6} {r['cpu_pct']:>6.1f} {r['memory_pct']:>6.1f}"
+            )
+        if any(r["wire_unknown"] for r in rows):
+            lines.append("? = wire size unknown for some responses (excluded from bw %)")
+        if not rows:
+            lines.append("(no responses recorded)")
+        return "\n".join(lines)
+
+    def write_report(self, path: Optional[str] = None) -> str:
+        """
+        Escribe el resumen en formato JSON y retorna la ruta del archivo.
+        :param path: archivo de salida; por defecto PAYLOAD_PROFILE_OUTPUT o payload_profile.json
+        """
+        path = path or os.getenv(OUTPUT_ENV, DEFAULT_OUTPUT)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"routes": self.summary()}, fh, indent=2)
+        return path
+
+
+# Instancia compartida por Behave (environment.py) y Locust (locustfile.py)
+profiler = PayloadProfiler()
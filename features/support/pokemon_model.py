@@ -12,7 +12,7 @@ Buenas prácticas:
 """
 
 from typing import List
-import requests  # Usado para obtener detalles del Pokémon desde la API
+from features.support.api_client import session  # Sesión HTTP compartida para obtener detalles del Pokémon
 
 class Pokemon:
     def __init__(self, name: str, url: str):
@@ -34,7 +34,7 @@ class Pokemon:
         """
         if not self.url:
             return
-        resp = requests.get(self.url, timeout=timeout)
+        resp = session.get(self.url, timeout=timeout)
         if resp.status_code != 200:
             # No se lanza excepción aquí — el llamador decide cómo manejar fallos.
             return
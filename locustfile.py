@@ -1,4 +1,15 @@
-from locust import HttpUser, task, between
+from locust import HttpUser, task, between, events
+
+from features.support.payload_profiler import is_enabled, profiler
+
+if is_enabled():
+    # HttpSession hereda de requests.Session, así que queda instrumentado igual que la suite
+    profiler.install()
+
+    @events.quitting.add_listener
+    def write_payload_profile(environment, **kwargs):
+        print(profiler.format_report())
+        print(f"Payload profile written to {profiler.write_report()}")
 
 class PokeUser(HttpUser):
     wait_time = between(1, 3)
@@ -0,0 +1,228 @@
+"""
+Runner unificado para las pruebas unitarias (pytest) y los features (Behave).
+
+Ejecuta ambas suites en un solo proceso, de modo que las dependencias (requests, jsonschema, behave, pytest)
+se importan y se inicializan una sola vez. Usa los resultados de la corrida anterior para ordenar:
+- lo que falló la última vez se ejecuta primero
+- luego lo más lento (duraciones de los features y de tests/unit guardadas en .pytest_cache)
+
+Uso:
+    python run_tests.py               # ambas suites
+    python run_tests.py --fail-fast   # se detiene en la primera falla
+    python run_tests.py --unit-html unit_test_report.html --features-html integration_report.html
+
+Buenas prácticas:
+- El historial de Behave se guarda en .pytest_cache (no versionado). Si aún no existe se usa
+  report.json, solo cuando es un reporte JSON de Behave; report.json nunca se sobrescribe.
+- El historial de los features no ejecutados (p. ej. por --fail-fast) se conserva.
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+import pytest
+from behave.__main__ import main as behave_main
+
+REPORT_FILE = "report.json"
+FEATURES_DIR = "features"
+UNIT_DIR = os.path.join("tests", "unit")
+PYTEST_LASTFAILED_FILE = os.path.join(".pytest_cache", "v", "cache", "lastfailed")
+# Mismo formato que REPORT_FILE (JSON de Behave), dentro de la caché de pytest
+FEATURE_HISTORY_FILE = os.path.join(".pytest_cache", "v", "run_tests", "features")
+DURATIONS_KEY = "run_tests/durations"
+FAILED_STATUSES = ("failed", "error")
+
+
+def _read_json(path: str):
+    """
+    Lee un archivo JSON y retorna None si no existe o no es válido.
+    """
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _feature_file(location: str) -> str:
+    """
+    Extrae el archivo .feature de una ubicación de Behave ("./features/x.feature:3" -> "features/x.feature").
+    """
+    return os.path.normpath(location.rsplit(":", 1)[0])
+
+
+def load_feature_history(path: str = FEATURE_HISTORY_FILE) -> Dict[str, dict]:
+    """
+    Lee un reporte JSON de Behave y retorna, por archivo .feature, si falló y cuánto tardó.
+    :param path: reporte generado con `behave -f json`
+    :return: {"features/x.feature": {"failed": bool, "duration": segundos}}
+    """
+    data = _read_json(path)
+    if not isinstance(data, list):
+        return {}
+    history = {}
+    for feature in data:
+        if not isinstance(feature, dict) or "location" not in feature:
+            continue
+        filename = _feature_file(feature["location"])
+        failed = feature.get("status") in FAILED_STATUSES
+        duration = 0.0
+        for element in feature.get("elements", []):
+            failed = failed or element.get("status") in FAILED_STATUSES
+            for step in element.get("steps", []):
+                duration += step.get("result", {}).get("duration", 0.0)
+        history[filename] = {"failed": failed, "duration": duration}
+    return history
+
+
+def load_history() -> Dict[str, dict]:
+    """
+    Retorna el historial guardado en la caché y, si no existe, el de report.json cuando es JSON de Behave.
+    """
+    return load_feature_history(FEATURE_HISTORY_FILE) or load_feature_history(REPORT_FILE)
+
+
+def order_features(feature_files: List[str], history: Dict[str, dict]) -> List[str]:
+    """
+    Ordena los archivos .feature: primero los que fallaron, luego los más lentos.
+    Los features sin historial van al final en su orden original.
+    """
+    def key(filename):
+        entry = history.get(os.path.normpath(filename), {})
+        return (not entry.get("failed", False), -entry.get("duration", 0.0))
+    return sorted(feature_files, key=key)
+
+
+def merge_report(previous_path: str, new_path: str) -> None:
+    """
+    Combina el reporte nuevo con el anterior, conservando los features que no se ejecutaron esta vez.
+    El resultado se escribe en previous_path con el mismo formato JSON de Behave.
+    """
+    new = _read_json(new_path) or []
+    previous = _read_json(previous_path)
+    ran = {_feature_file(f["location"]) for f in new if "location" in f}
+    if isinstance(previous, list):
+        new.extend(f for f in previous if isinstance(f, dict) and "location" in f
+                   and _feature_file(f["location"]) not in ran)
+    os.makedirs(os.path.dirname(previous_path) or ".", exist_ok=True)
+    with open(previous_path, "w", encoding="utf-8") as fh:
+        json.dump(new, fh, indent=2)
+
+
+class PytestOrderPlugin:
+    def __init__(self):
+        """
+        Plugin de pytest que ordena los tests (fallidos primero, luego los más lentos)
+        y guarda las duraciones en la caché de pytest para la próxima corrida.
+        """
+        self.durations: Dict[str, float] = {}
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        """
+        Reordena los tests recolectados usando lastfailed y las duraciones de la corrida anterior.
+        """
+        lastfailed = config.cache.get("cache/lastfailed", {})
+        durations = config.cache.get(DURATIONS_KEY, {})
+        items.sort(key=lambda item: (item.nodeid not in lastfailed, -durations.get(item.nodeid, 0.0)))
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Acumula la duración de setup, call y teardown de cada test.
+        """
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """
+        Persiste las duraciones, conservando las de tests que no se ejecutaron.
+        """
+        durations = session.config.cache.get(DURATIONS_KEY, {})
+        durations.update(self.durations)
+        session.config.cache.set(DURATIONS_KEY, durations)
+
+
+def run_unit(fail_fast: bool, html_report: Optional[str] = None) -> int:
+    """
+    Ejecuta tests/unit con pytest dentro del mismo proceso.
+    :param html_report: si se indica, genera ahí el reporte de pytest-html
+    """
+    args = ["-q", UNIT_DIR]
+    if fail_fast:
+        args.append("-x")
+    if html_report:
+        args.append(f"--html={html_report}")
+    return int(pytest.main(args, plugins=[PytestOrderPlugin()]))
+
+
+def run_features(fail_fast: bool, json_report: Optional[str] = None, html_report: Optional[str] = None) -> int:
+    """
+    Ejecuta los features con Behave dentro del mismo proceso, ordenados según el historial,
+    y actualiza el historial con los resultados.
+    :param json_report: si se indica, copia ahí el reporte JSON de Behave de esta corrida
+    :param html_report: si se indica, genera ahí el reporte de behave-html-formatter
+    """
+    feature_files = sorted(glob.glob(os.path.join(FEATURES_DIR, "*.feature")))
+    ordered = order_features(feature_files, load_history())
+
+    fd, new_report = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    args = ["-f", "json", "-o", new_report]
+    if html_report:
+        args += ["-f", "behave_html_formatter:HTMLFormatter", "-o", html_report]
+    args += ["-f", "progress"]
+    if fail_fast:
+        args.append("--stop")
+    try:
+        status = behave_main(args + ordered)
+        merge_report(FEATURE_HISTORY_FILE, new_report)
+        if json_report:
+            shutil.copyfile(new_report, json_report)
+    finally:
+        os.remove(new_report)
+    return int(status)
+
+
+def _unit_failed_last_time() -> bool:
+    """
+    Indica si pytest registró fallas en la corrida anterior.
+    """
+    return bool(_read_json(PYTEST_LASTFAILED_FILE))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run pytest and Behave suites in one process.")
+    parser.add_argument("--fail-fast", action="store_true", help="stop at the first failure")
+    parser.add_argument("--unit-html", help="write the pytest-html report to this file")
+    parser.add_argument("--features-json", help="write the Behave JSON report to this file")
+    parser.add_argument("--features-html", help="write the Behave HTML report to this file")
+    options = parser.parse_args(argv)
+
+    # Las rutas de las suites son relativas a la raíz del repositorio
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    suites = [
+        ("unit", lambda: run_unit(options.fail_fast, options.unit_html)),
+        ("features", lambda: run_features(options.fail_fast, options.features_json, options.features_html)),
+    ]
+    features_failed = any(e["failed"] for e in load_history().values())
+    if features_failed and not _unit_failed_last_time():
+        suites.reverse()
+
+    exit_code = 0
+    for name, run in suites:
+        print(f"=== Running {name} ===")
+        status = run()
+        exit_code = exit_code or status
+        if status and options.fail_fast:
+            print(f"Stopping after failures in {name} (--fail-fast)")
+            break
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
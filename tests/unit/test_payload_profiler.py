@@ -0,0 +1,209 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from features.support.payload_profiler import PayloadProfiler, deep_sizeof, route_template
+
+
+class FakeAdapter(BaseAdapter):
+    """Adaptador sin red que responde siempre con el mismo JSON."""
+
+    def __init__(self, payload, wire_bytes=None, encoding="gzip"):
+        super().__init__()
+        self.body = json.dumps(payload).encode()
+        self.wire_bytes = wire_bytes
+        self.encoding = encoding
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        response.headers["Content-Encoding"] = self.encoding
+        if self.wire_bytes is not None:
+            response.headers["Content-Length"] = str(self.wire_bytes)
+        response._content = self.body
+        return response
+
+    def close(self):
+        pass
+
+
+POKEMON_BODY = json.dumps({"moves": [{"move": {"name": f"move-{i}"}} for i in range(500)]}).encode()
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Sirve POKEMON_BODY comprimido con gzip, con Content-Length, chunked o corrupto según la ruta."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = gzip.compress(POKEMON_BODY)
+        if self.path.endswith("/corrupt"):
+            body = b"not gzip at all"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        if self.path.endswith("/chunked"):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 1000):
+                chunk = body[start:start + 1000]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gzip_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_session(payload, wire_bytes=None):
+    session = requests.Session()
+    session.mount("https://", FakeAdapter(payload, wire_bytes))
+    return session
+
+
+def test_route_template():
+    assert route_template("https://pokeapi.co/api/v2/pokemon/pikachu") == "/api/v2/pokemon/{id}"
+    assert route_template("https://pokeapi.co/api/v2/pokemon/25/") == "/api/v2/pokemon/{id}"
+    assert route_template("https://pokeapi.co/api/v2/pokemon?limit=20&offset=40") == "/api/v2/pokemon"
+    assert route_template("https://example.com/items/7") == "/items/{id}"
+
+
+def test_deep_sizeof_counts_nested_objects():
+    flat = {"name": "pikachu"}
+    nested = {"name": "pikachu", "moves": [{"move": "thunder"}] * 10}
+    assert deep_sizeof(nested) > deep_sizeof(flat)
+
+
+def test_profiler_records_and_ranks_routes():
+    profiler = PayloadProfiler()
+    profiler.install()
+    try:
+        big = make_session({"moves": [{"move": {"name": f"m{i}"}} for i in range(200)]}, wire_bytes=900)
+        small = make_session({"name": "static"}, wire_bytes=40)
+        big.get("https://pokeapi.co/api/v2/pokemon/pikachu")
+        big.get("https://pokeapi.co/api/v2/pokemon/1")
+        small.get("https://pokeapi.co/api/v2/ability/static")
+    finally:
+        profiler.uninstall()
+
+    rows = profiler.summary()
+    assert [r["route"] for r in rows] == ["/api/v2/pokemon/{id}", "/api/v2/ability/{id}"]
+    pokemon = rows[0]
+    assert pokemon["requests"] == 2
+    assert pokemon["content_encodings"] == ["gzip"]
+    assert pokemon["wire_bytes_total"] == 1800
+    assert pokemon["compression_ratio"] > 1
+    assert pokemon["object_bytes_max"] > rows[1]["object_bytes_max"]
+    assert round(sum(r["bandwidth_pct"] for r in rows)) == 100
+    assert "/api/v2/pokemon/{id}" in profiler.format_report()
+
+
+def test_uninstall_stops_recording():
+    profiler = PayloadProfiler()
+    profiler.install()
+    profiler.uninstall()
+    make_session({"name": "static"}, wire_bytes=40).get("https://pokeapi.co/api/v2/ability/static")
+    assert profiler.routes == {}
+
+
+@pytest.mark.parametrize("path", ["/api/v2/pokemon/1", "/api/v2/pokemon/chunked"])
+def test_wire_bytes_measured_for_gzip_responses(gzip_server, path):
+    profiler = PayloadProfiler()
+    profiler.install()
+    try:
+        response = requests.get(f"{gzip_server}{path}", timeout=5)
+    finally:
+        profiler.uninstall()
+
+    assert response.json() == json.loads(POKEMON_BODY)
+    stats = profiler.routes["/api/v2/pokemon/{id}"]
+    assert stats.content_encodings == {"gzip"}
+    assert stats.decoded_bytes_total == len(POKEMON_BODY)
+    assert stats.wire_bytes_total == len(gzip.compress(POKEMON_BODY))
+    assert stats.wire_bytes_total < stats.decoded_bytes_total
+
+
+def test_unknown_wire_bytes_excluded_from_bandwidth():
+    profiler = PayloadProfiler()
+    profiler.install()
+    try:
+        make_session({"name": "static"}).get("https://pokeapi.co/api/v2/ability/static")
+        make_session({"name": "pikachu"}, wire_bytes=40).get("https://pokeapi.co/api/v2/pokemon/pikachu")
+    finally:
+        profiler.uninstall()
+
+    rows = {r["route"]: r for r in profiler.summary()}
+    ability = rows["/api/v2/ability/{id}"]
+    assert ability["wire_unknown"] == 1
+    assert ability["wire_bytes_avg"] is None
+    assert ability["compression_ratio"] is None
+    assert ability["bandwidth_pct"] is None
+    assert rows["/api/v2/pokemon/{id}"]["bandwidth_pct"] == 100
+    assert "?" in profiler.format_report()
+
+
+def test_decode_is_deferred_until_summary():
+    profiler = PayloadProfiler()
+    profiler.install()
+    try:
+        make_session({"name": "pikachu"}, wire_bytes=40).get("https://pokeapi.co/api/v2/pokemon/pikachu")
+    finally:
+        profiler.uninstall()
+
+    stats = profiler.routes["/api/v2/pokemon/{id}"]
+    assert len(stats.pending_bodies) == 1 and stats.analyzed == 0
+    profiler.summary()
+    assert stats.pending_bodies == [] and stats.object_bytes_max > 0
+
+
+def test_only_first_bodies_per_route_are_kept():
+    profiler = PayloadProfiler(max_samples=2)
+    profiler.install()
+    try:
+        session = make_session({"name": "pikachu"}, wire_bytes=40)
+        for _ in range(5):
+            session.get("https://pokeapi.co/api/v2/pokemon/pikachu")
+    finally:
+        profiler.uninstall()
+
+    stats = profiler.routes["/api/v2/pokemon/{id}"]
+    assert stats.requests == 5
+    assert len(stats.pending_bodies) == 2
+    row = profiler.summary()[0]
+    assert row["wire_bytes_total"] == 200
+    assert row["decode_samples"] == 2
+    assert row["object_bytes_total"] == row["object_bytes_avg"] * 5
+
+
+@pytest.mark.parametrize("profiled", [False, True])
+def test_decode_errors_propagate_like_requests(gzip_server, profiled):
+    profiler = PayloadProfiler()
+    if profiled:
+        profiler.install()
+    try:
+        with pytest.raises(requests.exceptions.ContentDecodingError):
+            requests.get(f"{gzip_server}/api/v2/pokemon/corrupt", timeout=5)
+    finally:
+        profiler.uninstall()
@@ -0,0 +1,163 @@
+import json
+
+import pytest
+
+import run_tests
+from run_tests import DURATIONS_KEY, PytestOrderPlugin, load_feature_history, merge_report, order_features
+
+pytest_plugins = ["pytester"]
+
+
+def behave_feature(filename, status, durations):
+    return {
+        "location": f"{filename}:3",
+        "status": status,
+        "elements": [{
+            "location": f"{filename}:7",
+            "status": status,
+            "steps": [{"result": {"status": status, "duration": d}} for d in durations],
+        }],
+    }
+
+
+def write_report(path, features):
+    path.write_text(json.dumps(features), encoding="utf-8")
+    return str(path)
+
+
+def test_history_ignores_non_json_report(tmp_path):
+    report = tmp_path / "report.json"
+    report.write_text("Feature: Pokemon API - GET /pokemon/{pokemon}\n", encoding="utf-8")
+    assert load_feature_history(str(report)) == {}
+    assert load_feature_history(str(tmp_path / "missing.json")) == {}
+
+
+def test_failed_then_slow_features_first(tmp_path):
+    report = write_report(tmp_path / "report.json", [
+        behave_feature("features/fast.feature", "passed", [0.1]),
+        behave_feature("features/slow.feature", "passed", [1.0, 2.0]),
+        behave_feature("features/broken.feature", "failed", [0.1]),
+    ])
+    history = load_feature_history(report)
+    assert history["features/slow.feature"] == {"failed": False, "duration": 3.0}
+
+    files = ["features/fast.feature", "features/new.feature", "features/slow.feature", "features/broken.feature"]
+    assert order_features(files, history) == [
+        "features/broken.feature",
+        "features/slow.feature",
+        "features/fast.feature",
+        "features/new.feature",
+    ]
+
+
+def test_merge_report_keeps_features_not_run(tmp_path):
+    previous = write_report(tmp_path / "report.json", [
+        behave_feature("features/a.feature", "failed", [0.1]),
+        behave_feature("features/b.feature", "passed", [0.5]),
+    ])
+    new = write_report(tmp_path / "new.json", [behave_feature("features/a.feature", "passed", [0.2])])
+    merge_report(previous, new)
+
+    history = load_feature_history(previous)
+    assert history["features/a.feature"] == {"failed": False, "duration": 0.2}
+    assert history["features/b.feature"] == {"failed": False, "duration": 0.5}
+
+
+def test_merge_report_normalizes_feature_paths(tmp_path):
+    previous = write_report(tmp_path / "report.json", [behave_feature("./features/a.feature", "failed", [0.1])])
+    new = write_report(tmp_path / "new.json", [behave_feature("features/a.feature", "passed", [0.2])])
+    merge_report(previous, new)
+
+    merged = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert len(merged) == 1
+    assert load_feature_history(previous) == {"features/a.feature": {"failed": False, "duration": 0.2}}
+
+
+ORDER_TESTS = """
+import time
+
+def test_fast():
+    pass
+
+def test_slow():
+    time.sleep(0.2)
+
+def test_broken():
+    assert False
+"""
+
+
+def executed_order(result):
+    return [line.split("::")[1].split()[0] for line in result.outlines
+            if line.startswith("test_order.py::") and ("PASSED" in line or "FAILED" in line)]
+
+
+def test_pytest_plugin_runs_failed_then_slow_first(pytester):
+    pytester.makepyfile(test_order=ORDER_TESTS)
+
+    first = pytester.runpytest_inprocess("-v", plugins=[PytestOrderPlugin()])
+    first.assert_outcomes(passed=2, failed=1)
+    assert executed_order(first) == ["test_fast", "test_slow", "test_broken"]
+
+    second = pytester.runpytest_inprocess("-v", plugins=[PytestOrderPlugin()])
+    assert executed_order(second) == ["test_broken", "test_slow", "test_fast"]
+
+
+def test_pytest_plugin_keeps_durations_of_tests_not_run(pytester):
+    pytester.makepyfile(test_order=ORDER_TESTS)
+    pytester.runpytest_inprocess(plugins=[PytestOrderPlugin()])
+    pytester.runpytest_inprocess("-k", "fast", plugins=[PytestOrderPlugin()])
+
+    durations = json.loads((pytester.path / ".pytest_cache" / "v" / DURATIONS_KEY).read_text())
+    assert set(durations) == {"test_order.py::test_fast", "test_order.py::test_slow",
+                              "test_order.py::test_broken"}
+    assert durations["test_order.py::test_slow"] >= 0.2
+
+
+@pytest.fixture
+def fake_suites(monkeypatch, tmp_path):
+    """Reemplaza las suites por funciones que registran el orden de ejecución."""
+    calls = []
+    status = {"unit": 0, "features": 0}
+    history = {"features": {}, "unit_failed": False}
+
+    def fake_unit(fail_fast, html_report=None):
+        calls.append("unit")
+        return status["unit"]
+
+    def fake_features(fail_fast, json_report=None, html_report=None):
+        calls.append("features")
+        return status["features"]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(run_tests, "run_unit", fake_unit)
+    monkeypatch.setattr(run_tests, "run_features", fake_features)
+    monkeypatch.setattr(run_tests, "load_history", lambda: history["features"])
+    monkeypatch.setattr(run_tests, "_unit_failed_last_time", lambda: history["unit_failed"])
+    return calls, status, history
+
+
+def test_main_runs_unit_first_by_default(fake_suites):
+    calls, _, _ = fake_suites
+    assert run_tests.main([]) == 0
+    assert calls == ["unit", "features"]
+
+
+def test_main_runs_features_first_when_only_features_failed(fake_suites):
+    calls, _, history = fake_suites
+    history["features"] = {"features/a.feature": {"failed": True, "duration": 1.0}}
+    run_tests.main([])
+    assert calls == ["features", "unit"]
+
+    calls.clear()
+    history["unit_failed"] = True
+    run_tests.main([])
+    assert calls == ["unit", "features"]
+
+
+def test_main_fail_fast_stops_after_failing_suite(fake_suites):
+    calls, status, history = fake_suites
+    history["features"] = {"features/a.feature": {"failed": True, "duration": 1.0}}
+    status["features"] = 1
+    assert run_tests.main(["--fail-fast"]) == 1
+    assert calls == ["features"]
@@ -1,12 +1,13 @@
 import pytest
-import requests
+
+from features.support.api_client import session
 
 def test_sample():
     assert 1 + 1 == 2
 
 def test_pikachu_api_response():
     url = "https://pokeapi.co/api/v2/pokemon/pikachu"
-    response = requests.get(url)
+    response = session.get(url)
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "pikachu"